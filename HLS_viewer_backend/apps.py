@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class HlsViewerBackendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'HLS_viewer_backend'
+
+    def ready(self):
+        from . import signals  # noqa: F401
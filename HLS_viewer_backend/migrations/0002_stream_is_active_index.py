@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HLS_viewer_backend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stream',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AddIndex(
+            model_name='stream',
+            index=models.Index(fields=['is_active', '-created_at'], name='stream_active_created_idx'),
+        ),
+    ]
@@ -7,8 +7,13 @@ class Stream(models.Model):
     name = models.CharField(max_length=100, help_text="Display name for the stream")
     url = models.URLField(help_text="HLS stream URL (.m3u8)")
     description = models.TextField(blank=True, null=True, help_text="Optional stream info")
-    is_active = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', '-created_at'], name='stream_active_created_idx'),
+        ]
+
     def __str__(self):
         return self.name
@@ -1,7 +1,44 @@
+import serpy
 from rest_framework import serializers
 from .models import Stream
 
-class StreamSerializer(serializers.ModelSerializer):
+# matches the created_at format produced by StreamSerializer
+_datetime_field = serializers.DateTimeField()
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that takes an optional `fields` argument restricting the output."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class StreamSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Stream
         fields = '__all__'
+
+
+class StreamListSerializer(serpy.Serializer):
+    """Read-only serializer used for the list endpoint; writes go through StreamSerializer."""
+    id = serpy.IntField()
+    name = serpy.StrField()
+    url = serpy.StrField()
+    description = serpy.StrField(required=False)
+    is_active = serpy.BoolField()
+    created_at = serpy.MethodField()
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # drop unrequested fields so deferred columns are never touched
+        if fields is not None:
+            self._compiled_fields = tuple(f for f in self._compiled_fields if f[0] in fields)
+
+    def get_created_at(self, obj):
+        return _datetime_field.to_representation(obj.created_at)
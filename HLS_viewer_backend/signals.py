@@ -0,0 +1,13 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Stream
+
+ACTIVE_STREAMS_CACHE_KEY = 'hls_index:active_streams'
+
+
+@receiver(post_save, sender=Stream)
+@receiver(post_delete, sender=Stream)
+def invalidate_active_streams(sender, **kwargs):
+    cache.delete(ACTIVE_STREAMS_CACHE_KEY)
@@ -1,21 +1,65 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views import View
+from django.core.cache import cache
 from .models import *
 from rest_framework import viewsets
+from rest_framework.response import Response
 from .serializers import *
+from .signals import ACTIVE_STREAMS_CACHE_KEY
 
 # Create your views here.
 
 
 class StreamViewSet(viewsets.ModelViewSet):
-    queryset = Stream.objects.all().order_by('-created_at')
+    queryset = Stream.objects.only(
+        'id', 'name', 'url', 'description', 'is_active', 'created_at'
+    ).order_by('-created_at')
     serializer_class = StreamSerializer
+    selectable_fields = ('id', 'name', 'url', 'description', 'is_active', 'created_at')
+
+    def get_requested_fields(self):
+        """Columns asked for via ?fields=a,b on reads, or None for all of them."""
+        if self.action not in ('list', 'retrieve'):
+            return None
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        cols = [f for f in fields.split(',') if f in self.selectable_fields]
+        return cols or None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fields = self.get_requested_fields()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(StreamListSerializer(page, many=True, fields=fields).data)
+
+        return Response(StreamListSerializer(queryset, many=True, fields=fields).data)
 
 class HlsIndexView(View):
     template_name = 'index.html'
 
     def get(self, request):
-        streams = Stream.objects.filter(is_active=True)
+        # Cache the rows rather than the rendered page: the page carries a per-user CSRF token.
+        # Entries are dropped by the Stream save/delete signals; the timeout covers bulk updates.
+        streams = cache.get(ACTIVE_STREAMS_CACHE_KEY)
+        if streams is None:
+            streams = list(
+                Stream.objects.filter(is_active=True).order_by('-created_at').values('id', 'name', 'url')
+            )
+            cache.set(ACTIVE_STREAMS_CACHE_KEY, streams, 300)
         return render(request, self.template_name, {'streams': streams})
 
 